@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
+from weakref import WeakKeyDictionary
 import six
-from funcy import memoize, merge
 
 from django.conf import settings as base_settings
 from django.core.exceptions import ImproperlyConfigured
+try:
+    from django.core.signals import setting_changed
+except ImportError:
+    # Django 1.7
+    from django.test.signals import setting_changed
 
 
-ALL_OPS = {'get', 'fetch', 'count', 'exists'}
+ALL_OPS = frozenset(['get', 'fetch', 'count', 'exists'])
+NOT_SET = object()
 
 
 class Settings(object):
@@ -20,18 +26,32 @@ class Settings(object):
     FILE_CACHE_TIMEOUT = 60*60*24*30
 
     def __getattribute__(self, name):
-        if hasattr(base_settings, name):
-            return getattr(base_settings, name)
-        return object.__getattribute__(self, name)
+        try:
+            return _settings_cache[name]
+        except KeyError:
+            value = getattr(base_settings, name, NOT_SET)
+            if value is NOT_SET:
+                value = object.__getattribute__(self, name)
+            _settings_cache[name] = value
+            return value
 
 settings = Settings()
+_settings_cache = {}
 
 
-@memoize
+_profiles = None
+
 def prepare_profiles():
     """
     Prepares a dict 'app.model' -> profile, for use in model_profile()
     """
+    global _profiles
+    if _profiles is None:
+        _profiles = _prepare_profiles()
+    return _profiles
+
+
+def _prepare_profiles():
     profile_defaults = {
         'ops': (),
         'local_get': False,
@@ -47,13 +67,13 @@ def prepare_profiles():
             model_profiles[app_model.lower()] = None
             continue
 
-        model_profiles[app_model.lower()] = mp = merge(profile_defaults, profile)
+        model_profiles[app_model.lower()] = mp = dict(profile_defaults, **profile)
         if mp['ops'] == 'all':
             mp['ops'] = ALL_OPS
         # People will do that anyway :)
         if isinstance(mp['ops'], six.string_types):
             mp['ops'] = {mp['ops']}
-        mp['ops'] = set(mp['ops'])
+        mp['ops'] = frozenset(mp['ops'])
 
         if 'timeout' not in mp:
             raise ImproperlyConfigured(
@@ -62,6 +82,10 @@ def prepare_profiles():
     return model_profiles
 
 
+# model -> profile, filled on first lookup, weak not to hold reloaded or dynamic models
+_model_profiles = WeakKeyDictionary()
+
+
 def model_profile(model):
     """
     Returns cacheops profile for a model
@@ -69,10 +93,18 @@ def model_profile(model):
     if model_is_fake(model):
         return None
 
+    try:
+        return _model_profiles[model]
+    except KeyError:
+        profile = _model_profiles[model] = \
+            _resolve_profile(model._meta.app_label, model._meta.model_name)
+        return profile
+
+
+def _resolve_profile(app_label, model_name):
     model_profiles = prepare_profiles()
 
-    app = model._meta.app_label.lower()
-    model_name = model._meta.model_name
+    app = app_label.lower()
     for guess in ('%s.%s' % (app, model_name), '%s.*' % app, '*.*'):
         if guess in model_profiles:
             return model_profiles[guess]
@@ -82,3 +114,12 @@ def model_profile(model):
 
 def model_is_fake(model):
     return model.__module__ == '__fake__'
+
+
+def reset_settings(**kwargs):
+    global _profiles
+    _settings_cache.clear()
+    _profiles = None
+    _model_profiles.clear()
+
+setting_changed.connect(reset_settings)
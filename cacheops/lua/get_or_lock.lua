@@ -0,0 +1,15 @@
+local key = KEYS[1]
+local signal_key = KEYS[2]
+local timeout = ARGV[1]
+
+
+-- Return data or 'LOCK' if someone else is already computing it
+local data = redis.call('get', key)
+if data then
+    return data
+end
+
+-- No data, lock it, no one could lock it in between since scripts are atomic
+redis.call('set', key, 'LOCK', 'ex', timeout)
+redis.call('del', signal_key)
+return false
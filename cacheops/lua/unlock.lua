@@ -0,0 +1,10 @@
+local key = KEYS[1]
+local signal_key = KEYS[2]
+
+
+if redis.call('get', key) == 'LOCK' then
+    redis.call('del', key)
+end
+-- Wake up waiters, the signal is kept for a while for those not yet waiting
+redis.call('lpush', signal_key, 1)
+redis.call('expire', signal_key, 1)
@@ -9,15 +9,22 @@ import redis
 from .conf import settings
 
 
+CONNECTION_ERRORS = (redis.ConnectionError, redis.TimeoutError)
+
+def warn_connection_failure(e):
+    if isinstance(e, redis.TimeoutError):
+        warnings.warn("The cacheops cache timed out! Error: %s" % e, RuntimeWarning)
+    else:
+        warnings.warn("The cacheops cache is unreachable! Error: %s" % e, RuntimeWarning)
+
+
 if settings.CACHEOPS_DEGRADE_ON_FAILURE:
     @decorator
     def handle_connection_failure(call):
         try:
             return call()
-        except redis.ConnectionError as e:
-            warnings.warn("The cacheops cache is unreachable! Error: %s" % e, RuntimeWarning)
-        except redis.TimeoutError as e:
-            warnings.warn("The cacheops cache timed out! Error: %s" % e, RuntimeWarning)
+        except CONNECTION_ERRORS as e:
+            warn_connection_failure(e)
 else:
     handle_connection_failure = identity
 
@@ -26,7 +33,13 @@ LOCK_TIMEOUT = 60
 
 
 class CacheopsRedis(redis.StrictRedis):
-    get = handle_connection_failure(redis.StrictRedis.get)
+    if settings.CACHEOPS_DEGRADE_ON_FAILURE:
+        # Written out instead of decorated to keep this hot path flat
+        def get(self, name):
+            try:
+                return redis.StrictRedis.get(self, name)
+            except CONNECTION_ERRORS as e:
+                warn_connection_failure(e)
 
     @contextmanager
     def getting(self, key, lock=False):
@@ -44,37 +57,22 @@ class CacheopsRedis(redis.StrictRedis):
 
     @handle_connection_failure
     def _get_or_lock(self, key):
-        self._lock = getattr(self, '_lock', self.register_script("""
-            local locked = redis.call('set', KEYS[1], 'LOCK', 'nx', 'ex', ARGV[1])
-            if locked then
-                redis.call('del', KEYS[2])
-            end
-            return locked
-        """))
         signal_key = key + ':signal'
 
         while True:
-            data = self.get(key)
-            if data is None:
-                if self._lock(keys=[key, signal_key], args=[LOCK_TIMEOUT]):
-                    return None
-            elif data != b'LOCK':
+            # Returns None if we've got the lock, b'LOCK' if someone else has it
+            data = load_script('get_or_lock')(
+                keys=[key, signal_key], args=[LOCK_TIMEOUT], client=self)
+            if data != b'LOCK':
                 return data
 
-            # No data and not locked, wait
+            # Someone else is computing data, wait for it
             self.brpoplpush(signal_key, signal_key, timeout=LOCK_TIMEOUT)
 
     @handle_connection_failure
     def _release_lock(self, key):
-        self._unlock = getattr(self, '_unlock', self.register_script("""
-            if redis.call('get', KEYS[1]) == 'LOCK' then
-                redis.call('del', KEYS[1])
-            end
-            redis.call('lpush', KEYS[2], 1)
-            redis.call('expire', KEYS[2], 1)
-        """))
         signal_key = key + ':signal'
-        self._unlock(keys=[key, signal_key])
+        load_script('unlock')(keys=[key, signal_key], client=self)
 
 
 class LazyRedis(object):
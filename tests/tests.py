@@ -3,7 +3,7 @@ import re
 import unittest
 
 from django.db import connection, connections
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.test.client import RequestFactory
 from django.contrib.auth.models import User
 from django.template import Context, Template
@@ -915,6 +915,29 @@ class SignalsTests(BaseTestCase):
         self.assertEqual(self.signal_calls, [{'sender': None, 'func': func, 'hit': True}])
 
 
+class SettingsTests(BaseTestCase):
+    fixtures = ['basic']
+
+    def test_override_enabled(self):
+        list(Category.objects.cache())
+
+        with override_settings(CACHEOPS_ENABLED=False):
+            with self.assertNumQueries(1):
+                list(Category.objects.cache())
+
+        with self.assertNumQueries(0):
+            list(Category.objects.cache())
+
+    def test_override_profiles(self):
+        from cacheops.conf import model_profile
+        self.assertEqual(model_profile(Category)['timeout'], 60*60)
+
+        with override_settings(CACHEOPS={'tests.category': {'timeout': 10}}):
+            self.assertEqual(model_profile(Category)['timeout'], 10)
+
+        self.assertEqual(model_profile(Category)['timeout'], 60*60)
+
+
 class LockingTests(BaseTestCase):
     def test_lock(self):
         import random